@@ -1,6 +1,5 @@
 import streamlit as st
-import subprocess
-import sys
+from site_data import load_site_metadata
 
 # Page configuration
 st.set_page_config(
@@ -35,9 +34,7 @@ def main():
         """)
         
         if st.button("📊 Open Data Analysis Dashboard", use_container_width=True, type="primary"):
-            st.info("🚀 **Starting Data Analysis Dashboard...**")
-            st.code("streamlit run dashboard.py", language="bash")
-            st.markdown("**Or run:** `python run_dashboard.py`")
+            st.switch_page("pages/1_Analysis.py")
     
     with col2:
         st.markdown("""
@@ -51,9 +48,7 @@ def main():
         """)
         
         if st.button("🗺️ Open Spatial Dashboard", use_container_width=True, type="primary"):
-            st.info("🚀 **Starting Spatial Dashboard...**")
-            st.code("streamlit run spatial_dashboard.py", language="bash")
-            st.markdown("**Or run:** `python run_spatial_dashboard.py`")
+            st.switch_page("pages/2_Spatial.py")
     
     st.markdown("---")
     
@@ -61,7 +56,9 @@ def main():
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.metric("🗺️ Total Sites", "27", help="Monitoring stations across Indonesia")
+        # Warms the shared metadata cache the spatial dashboard reads from
+        sites = load_site_metadata()
+        st.metric("🗺️ Total Sites", len(sites) if sites is not None else "N/A", help="Monitoring stations across Indonesia")
     
     with col2:
         st.metric("📊 Parameters", "4", help="Temperature, Humidity, Wind Speed, Wind Direction")
@@ -75,13 +72,11 @@ def main():
     st.subheader("📋 How to Use")
     
     st.markdown("""
-    1. **Choose a dashboard** using the buttons above
-    2. **Follow the instructions** to open the selected dashboard
-    3. **Each dashboard runs independently** in a separate Streamlit session
+    1. **Choose a dashboard** using the buttons above or the sidebar
+    2. **Switch between dashboards** at any time from the sidebar
+    3. **All dashboards share one Streamlit session**, so loaded data stays cached
     
-    **Note:** You can also run the dashboards directly from command line:
-    - `streamlit run dashboard.py` - for data analysis
-    - `streamlit run spatial_dashboard.py` - for spatial overview
+    **Note:** Start the app from this page with `streamlit run main_page.py`
     """)
 
 if __name__ == "__main__":
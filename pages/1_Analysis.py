@@ -0,0 +1,736 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.express as px
+from plotly.subplots import make_subplots
+from plotly_resampler import FigureResampler
+from datetime import datetime, timedelta
+import io
+import numpy as np
+from PIL import Image
+
+# Page configuration
+st.set_page_config(
+    page_title="Microclimate Analysis Dashboard",
+    page_icon="🌡️",
+    layout="wide",
+    initial_sidebar_state="collapsed"
+)
+
+# Custom CSS for styling
+_CSS = """
+<style>
+    .main-header {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 10px;
+        margin-bottom: 1rem;
+    }
+    .height-section {
+        background-color: #ffffff;
+        padding: 1rem;
+        border-radius: 8px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        margin: 0.5rem 0;
+        border-left: 4px solid #1f77b4;
+    }
+    .height-4m { border-left-color: #ff7f0e; }
+    .height-7m { border-left-color: #2ca02c; }
+    .height-10m { border-left-color: #d62728; }
+    
+    .stMetric {
+        background-color: white;
+        padding: 0.5rem;
+        border-radius: 6px;
+        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    }
+</style>
+"""
+
+
+# Whitespace-collapsed once at import, since the stylesheet is re-sent every rerun
+_CSS_COMPACT = ' '.join(_CSS.split())
+
+
+def _inject_css():
+    """Emit the dashboard stylesheet
+
+    Streamlit drops any element a rerun does not re-emit, so this has to run on
+    every rerun rather than behind st.cache_resource.
+    """
+    st.markdown(_CSS_COMPACT, unsafe_allow_html=True)
+
+
+_inject_css()
+
+# Logger schema: every reading column is '<param><height>_<stat>', e.g. tt4_avg
+HEIGHTS = ('4', '7', '10')
+PARAMS = ('tt', 'rh', 'ws', 'wd')
+STATS = ('now', 'avg', 'min', 'max')
+COLS = {
+    (param, height, stat): f'{param}{height}_{stat}'
+    for param in PARAMS
+    for height in HEIGHTS
+    for stat in STATS
+}
+SUM_COLS = {height: f'sum_ws{height}' for height in HEIGHTS}
+
+# Logger columns with a known numeric schema; float32 halves memory vs float64
+NUMERIC_DTYPES = {col: 'float32' for col in [*COLS.values(), *SUM_COLS.values()]}
+
+# History shown by the time series charts; None means the whole file
+TIME_WINDOWS = {
+    'Last 24 hours': pd.Timedelta(hours=24),
+    'Last 7 days': pd.Timedelta(days=7),
+    'Last 30 days': pd.Timedelta(days=30),
+    'All': None
+}
+
+# Uploads kept parsed across all sessions; older ones are released
+UPLOAD_CACHE_ENTRIES = 2
+
+# Figures kept per chart builder across all sessions: every time window of the
+# most recent uploads, so old uploads' full-resolution arrays are released
+CHART_CACHE_ENTRIES = UPLOAD_CACHE_ENTRIES * len(TIME_WINDOWS)
+
+# Rows parsed per read_csv chunk when loading logger files
+CSV_CHUNK_ROWS = 100_000
+
+# Timestamp format written by the loggers
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Above this many rows, dense series are rasterised instead of sent as traces
+DENSE_ROW_THRESHOLD = 100_000
+# Above this many rows, wind direction markers are rasterised as well
+DENSE_MARKER_THRESHOLD = 20_000
+# (width, height) in pixels of the rasterised density layer
+RASTER_SIZE = (1200, 400)
+
+# 8-point compass labels, one per 45° sector starting at north
+CARDINAL_DIRECTIONS = np.array(['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'])
+
+
+def _cardinal_sectors(degrees):
+    """Map wind directions in degrees to int8 compass sector codes, -1 where missing"""
+    sectors = (np.nan_to_num(degrees) + 22.5) // 45 % 8
+    return np.where(np.isnan(degrees), -1, sectors).astype(np.int8)
+
+
+def _read_csv_chunks(file_bytes, **kwargs):
+    """Read CSV bytes in CSV_CHUNK_ROWS pieces so parser buffers stay bounded"""
+    chunks = pd.read_csv(io.BytesIO(file_bytes), chunksize=CSV_CHUNK_ROWS, **kwargs)
+    return pd.concat(chunks, ignore_index=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=UPLOAD_CACHE_ENTRIES)
+def _parse_csv(file_bytes: bytes) -> tuple[pd.DataFrame, np.ndarray]:
+    """Parse raw microclimate CSV bytes into a clean, time-sorted DataFrame
+
+    Also returns the int8 compass sector codes of every row's current wind
+    direction, one column per height, kept apart from the frame so its columns
+    and exports match the uploaded file.
+    """
+    try:
+        # Known logger columns are typed by the C parser in a single pass
+        df = _read_csv_chunks(file_bytes, dtype=NUMERIC_DTYPES)
+    except ValueError:
+        # A malformed reading defeats the typed fast path; coerce below instead.
+        # Each chunk's columns are inferred whole, so mixed text and numbers read
+        # as text without a DtypeWarning
+        df = _read_csv_chunks(file_bytes, low_memory=False)
+
+    # Parse date_time with the logger's fixed format, which stays on pandas' fast path
+    date_time = pd.to_datetime(df['date_time'], format=DATETIME_FORMAT, errors='coerce', cache=True)
+    if date_time.isna().all() and df['date_time'].notna().any():
+        # Not the usual logger format; let pandas infer it instead
+        date_time = pd.to_datetime(df['date_time'], errors='coerce', cache=True)
+    df['date_time'] = date_time
+
+    # Convert any other columns the parser left as text (except id_logger/date_time) to numeric
+    numeric_columns = [
+        col for col in df.columns
+        if col not in ['id_logger', 'date_time'] and not pd.api.types.is_numeric_dtype(df[col])
+    ]
+    for col in numeric_columns:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+
+    # Downcast whatever is still float64 and the logger ID to halve memory
+    float64_columns = df.select_dtypes('float64').columns
+    df[float64_columns] = df[float64_columns].astype('float32')
+    if pd.api.types.is_integer_dtype(df['id_logger']):
+        df['id_logger'] = pd.to_numeric(df['id_logger'], downcast='integer')
+
+    # Sort with missing datetimes last and slice them off: one copy instead of
+    # separate dropna, sort and reset_index passes
+    df = df.sort_values('date_time', ignore_index=True, na_position='last')
+    df = df.iloc[:df['date_time'].notna().sum()]
+
+    # Bucket wind directions for all heights in one pass over a single 2-D block
+    wind_sectors = _cardinal_sectors(df[[COLS['wd', height, 'now'] for height in HEIGHTS]].to_numpy())
+    return df, wind_sectors
+
+
+def load_microclimate_data():
+    """Upload and analyze microclimate CSV file"""
+    uploaded_file = st.file_uploader("📁 Upload Microclimate CSV File", type="csv")
+
+    if uploaded_file is not None:
+        try:
+            # Parsing is cached on the file contents, so reruns skip it
+            df, wind_sectors = _parse_csv(uploaded_file.getvalue())
+
+            # Display analysis summary in the sidebar or main area
+            st.success("✅ Data loaded successfully!")
+            st.markdown(f"**📊 Shape:** {df.shape}")
+            st.markdown(f"**📅 Date Range:** {df['date_time'].min()} to {df['date_time'].max()}")
+            st.markdown(f"**📋 Columns:** {', '.join(df.columns)}")
+
+            return df, wind_sectors
+
+        except Exception as e:
+            st.error(f"❌ Failed to process file: {str(e)}")
+            return None, None
+    else:
+        st.info("📂 Please upload a CSV file to begin.")
+        return None, None
+
+
+# One data export and one summary export per upload
+@st.cache_data(show_spinner=False, max_entries=2 * UPLOAD_CACHE_ENTRIES)
+def _to_csv(df: pd.DataFrame) -> bytes:
+    """Serialise a DataFrame for download, cached so reruns skip the formatting"""
+    return df.to_csv(index=False).encode()
+
+
+def _resampled_figure():
+    """Empty figure that downsamples each trace to a fixed 1000-point view
+
+    st.plotly_chart has no callback to resample on zoom, so the shipped aggregate
+    is static; the [R] badge and aggregation-size suffix are dropped so legend
+    and hover entries keep their trace names.
+    """
+    return FigureResampler(
+        go.Figure(),
+        resampled_trace_prefix_suffix=('', ''),
+        show_mean_aggregation_size=False
+    )
+
+
+def add_density_layer(fig, x, layers, y_range=None, range_values=()):
+    """Rasterise dense series into a single image drawn beneath the figure's traces
+
+    Each (values, colour) layer is binned onto a RASTER_SIZE grid and shaded by
+    log point count, datashader-style, so the browser receives one PNG instead
+    of every sample. range_values are the figure's other series on the same
+    axis; they widen the pinned y range so those traces stay on screen.
+    """
+    # Layers without a single valid sample have nothing to draw
+    layers = [(values, color) for values, color in layers if np.isfinite(values).any()]
+    if not layers:
+        return
+    
+    width, height = RASTER_SIZE
+    t = x.astype('datetime64[ns]').astype(np.int64)
+    t_range = (t.min(), t.max())
+    if y_range is None:
+        series = [values for values, _ in layers] + list(range_values)
+        finite = np.concatenate([values[np.isfinite(values)] for values in series])
+        y_range = (finite.min(), finite.max())
+        if y_range[0] == y_range[1]:
+            # A flat series still needs some height to be drawn
+            y_range = (y_range[0] - 0.5, y_range[1] + 0.5)
+    
+    # Composite the layers with premultiplied alpha, first layer at the bottom
+    rgb = np.zeros((height, width, 3))
+    alpha = np.zeros((height, width))
+    for values, color in layers:
+        valid = np.isfinite(values)
+        counts, _, _ = np.histogram2d(values[valid], t[valid], bins=(height, width), range=(y_range, t_range))
+        # Image row 0 is the top of the plot
+        shade = np.log1p(counts[::-1]) / max(np.log1p(counts.max()), 1.0)
+        color_rgb = np.array([int(color[i:i + 2], 16) for i in (1, 3, 5)]) / 255
+        rgb = color_rgb * shade[..., None] + rgb * (1 - shade[..., None])
+        alpha = shade + alpha * (1 - shade)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rgb = np.nan_to_num(rgb / alpha[..., None])
+    pixels = (np.dstack([rgb, alpha]) * 255).astype(np.uint8)
+    
+    fig.add_layout_image(
+        source=Image.fromarray(pixels),
+        xref='x',
+        yref='y',
+        x=pd.Timestamp(t_range[0]),
+        y=y_range[1],
+        # Date axes measure image width in milliseconds
+        sizex=(t_range[1] - t_range[0]) / 1e6,
+        sizey=y_range[1] - y_range[0],
+        sizing='stretch',
+        layer='below'
+    )
+    # Images do not take part in autorange, so pin both axes to the raster
+    fig.update_xaxes(type='date', range=[pd.Timestamp(t_range[0]), pd.Timestamp(t_range[1])])
+    fig.update_yaxes(range=list(y_range))
+
+
+@st.cache_resource(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def create_temperature_comparison_chart(df):
+    """Create temperature comparison chart for all heights"""
+    # Only a view-sized downsample of each trace is shipped to the browser
+    fig = _resampled_figure()
+    x = df['date_time'].values
+    dense = len(df) > DENSE_ROW_THRESHOLD
+    bands = []
+    averages = []
+    
+    colors = ['#ff7f0e', '#2ca02c', '#d62728']
+    
+    for i, height in enumerate(HEIGHTS):
+        # Add average temperature line
+        averages.append(df[COLS['tt', height, 'avg']].values)
+        fig.add_trace(go.Scattergl(
+            mode='lines',
+            name=f'{height}m (Avg)',
+            line=dict(color=colors[i], width=2)
+        ), hf_x=x, hf_y=averages[-1])
+        
+        # Add min-max range
+        if dense:
+            # Rasterised into the density layer instead
+            bands += [(df[COLS['tt', height, 'min']].values, colors[i]), (df[COLS['tt', height, 'max']].values, colors[i])]
+            continue
+        
+        fig.add_trace(go.Scattergl(
+            mode='lines',
+            line=dict(color=colors[i], width=0),
+            showlegend=False,
+            hovertemplate=f'{height}m Max: %{{y:.1f}}°C<extra></extra>'
+        ), hf_x=x, hf_y=df[COLS['tt', height, 'max']].values)
+        
+        fig.add_trace(go.Scattergl(
+            mode='lines',
+            fill='tonexty',
+            fillcolor=f'rgba({int(colors[i][1:3], 16)}, {int(colors[i][3:5], 16)}, {int(colors[i][5:7], 16)}, 0.2)',
+            line=dict(color=colors[i], width=0),
+            name=f'{height}m (Range)',
+            hovertemplate=f'{height}m Min: %{{y:.1f}}°C<extra></extra>'
+        ), hf_x=x, hf_y=df[COLS['tt', height, 'min']].values)
+    
+    if bands:
+        # The averages share the axis, so they take part in its range too
+        add_density_layer(fig, x, bands, range_values=averages)
+    
+    fig.update_layout(
+        title="Temperature Comparison by Height (°C)",
+        xaxis_title="Time",
+        yaxis_title="Temperature (°C)",
+        height=400,
+        hovermode='x unified'
+    )
+    
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def create_humidity_comparison_chart(df):
+    """Create humidity comparison chart for all heights"""
+    fig = _resampled_figure()
+    x = df['date_time'].values
+    dense = len(df) > DENSE_ROW_THRESHOLD
+    bands = []
+    averages = []
+    
+    colors = ['#ff7f0e', '#2ca02c', '#d62728']
+    
+    for i, height in enumerate(HEIGHTS):
+        averages.append(df[COLS['rh', height, 'avg']].values)
+        fig.add_trace(go.Scattergl(
+            mode='lines',
+            name=f'{height}m (Avg)',
+            line=dict(color=colors[i], width=2)
+        ), hf_x=x, hf_y=averages[-1])
+        
+        # Add min-max range
+        if dense:
+            # Rasterised into the density layer instead
+            bands += [(df[COLS['rh', height, 'min']].values, colors[i]), (df[COLS['rh', height, 'max']].values, colors[i])]
+            continue
+        
+        fig.add_trace(go.Scattergl(
+            mode='lines',
+            line=dict(color=colors[i], width=0),
+            showlegend=False
+        ), hf_x=x, hf_y=df[COLS['rh', height, 'max']].values)
+        
+        fig.add_trace(go.Scattergl(
+            mode='lines',
+            fill='tonexty',
+            fillcolor=f'rgba({int(colors[i][1:3], 16)}, {int(colors[i][3:5], 16)}, {int(colors[i][5:7], 16)}, 0.2)',
+            line=dict(color=colors[i], width=0),
+            name=f'{height}m (Range)'
+        ), hf_x=x, hf_y=df[COLS['rh', height, 'min']].values)
+    
+    if bands:
+        # The averages share the axis, so they take part in its range too
+        add_density_layer(fig, x, bands, range_values=averages)
+    
+    fig.update_layout(
+        title="Humidity Comparison by Height (%)",
+        xaxis_title="Time",
+        yaxis_title="Relative Humidity (%)",
+        height=400,
+        hovermode='x unified'
+    )
+    
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def create_wind_speed_comparison_chart(df):
+    """Create wind speed comparison chart for all heights"""
+    fig = _resampled_figure()
+    x = df['date_time'].values
+    dense = len(df) > DENSE_ROW_THRESHOLD
+    bands = []
+    averages = []
+    
+    colors = ['#ff7f0e', '#2ca02c', '#d62728']
+    
+    for i, height in enumerate(HEIGHTS):
+        averages.append(df[COLS['ws', height, 'avg']].values)
+        fig.add_trace(go.Scattergl(
+            mode='lines',
+            name=f'{height}m (Avg)',
+            line=dict(color=colors[i], width=2)
+        ), hf_x=x, hf_y=averages[-1])
+        
+        # Add max wind speed
+        if dense:
+            # Rasterised into the density layer instead
+            bands.append((df[COLS['ws', height, 'max']].values, colors[i]))
+            continue
+        
+        fig.add_trace(go.Scattergl(
+            mode='lines',
+            name=f'{height}m (Max)',
+            line=dict(color=colors[i], width=1, dash='dot')
+        ), hf_x=x, hf_y=df[COLS['ws', height, 'max']].values)
+    
+    if bands:
+        # The averages share the axis, so they take part in its range too
+        add_density_layer(fig, x, bands, range_values=averages)
+    
+    fig.update_layout(
+        title="Wind Speed Comparison by Height (m/s)",
+        xaxis_title="Time",
+        yaxis_title="Wind Speed (m/s)",
+        height=400,
+        hovermode='x unified'
+    )
+    
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=CHART_CACHE_ENTRIES * len(HEIGHTS))
+def create_wind_direction_chart(df, height):
+    """Create wind direction scatter plot for specific height"""
+    fig = go.Figure()
+    
+    colors = {'4': '#ff7f0e', '7': '#2ca02c', '10': '#d62728'}
+    
+    if len(df) < DENSE_MARKER_THRESHOLD:
+        fig.add_trace(go.Scattergl(
+            x=df['date_time'],
+            y=df[COLS['wd', height, 'avg']],
+            mode='markers',
+            name=f'{height}m Wind Direction',
+            marker=dict(color=colors[height], size=3, opacity=0.4)
+        ))
+    else:
+        # Too many samples for individual markers; draw their density instead
+        add_density_layer(
+            fig,
+            df['date_time'].values,
+            [(df[COLS['wd', height, 'avg']].values, colors[height])],
+            y_range=(0, 360)
+        )
+    
+    # Reference lines for cardinal directions, set in the single layout update
+    cardinal_lines = [
+        dict(type='line', xref='paper', x0=0, x1=1, y0=y, y1=y,
+             line=dict(color='gray', dash='dash'), opacity=0.5)
+        for y in (0, 90, 180, 270, 360)
+    ]
+    
+    fig.update_layout(
+        title=f"Wind Direction at {height}m Height (°)",
+        xaxis_title="Time",
+        yaxis_title="Wind Direction (°)",
+        height=300,
+        showlegend=False,
+        yaxis=dict(range=[0, 360]),
+        shapes=cardinal_lines
+    )
+    
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=CHART_CACHE_ENTRIES)
+def create_vertical_profile_chart(latest, parameter, param_name, unit):
+    """Create vertical profile chart showing parameter variation with height"""
+    heights = [int(height) for height in HEIGHTS]
+    min_vals = [latest[COLS[parameter, height, 'min']] for height in HEIGHTS]
+    avg_vals = [latest[COLS[parameter, height, 'avg']] for height in HEIGHTS]
+    max_vals = [latest[COLS[parameter, height, 'max']] for height in HEIGHTS]
+    
+    fig = go.Figure()
+    
+    # Add min, avg, max lines
+    fig.add_trace(go.Scatter(
+        x=min_vals, y=heights,
+        mode='lines+markers',
+        name='Minimum',
+        line=dict(color='blue', dash='dash'),
+        marker=dict(size=8)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=avg_vals, y=heights,
+        mode='lines+markers',
+        name='Average',
+        line=dict(color='red', width=3),
+        marker=dict(size=10)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=max_vals, y=heights,
+        mode='lines+markers',
+        name='Maximum',
+        line=dict(color='green', dash='dash'),
+        marker=dict(size=8)
+    ))
+    
+    fig.update_layout(
+        title=f"Vertical Profile - {param_name}",
+        xaxis_title=f"{param_name} ({unit})",
+        yaxis_title="Height (m)",
+        height=400,
+        yaxis=dict(tickvals=[4, 7, 10])
+    )
+    
+    return fig
+
+def create_statistics_table(latest, parameter, value_format):
+    """Create per-height statistics table of the latest readings for a parameter"""
+    values = np.array([
+        [latest[COLS[parameter, height, stat]] for stat in STATS]
+        for height in HEIGHTS
+    ], dtype=float)
+    
+    # Format every cell in one vectorised pass
+    return pd.DataFrame(
+        np.char.mod(value_format, values),
+        columns=['Current', 'Average', 'Min', 'Max'],
+        index=pd.Index([f'{height}m' for height in HEIGHTS], name='Height')
+    )
+
+def main():
+    # Load data
+    df, wind_sectors = load_microclimate_data()
+    
+    if df is None:
+        st.error("Failed to load microclimate data. Please check the file.")
+        return
+    
+    # Get latest readings as a plain dict; they are looked up dozens of times below
+    latest = df.iloc[-1].to_dict()
+    
+    # Compass labels of the latest reading, from the codes bucketed at parse time
+    latest_cardinals = {
+        height: CARDINAL_DIRECTIONS[code] if code >= 0 else 'N/A'
+        for height, code in zip(HEIGHTS, wind_sectors[-1])
+    }
+    
+    # Header
+    st.markdown(f"""
+    <div class="main-header">
+        <h1>🌡️ Microclimate Analysis Dashboard</h1>
+        <p>📊 Multi-Height Weather Station Data Analysis</p>
+        <p style="text-align: right; margin: 0;">
+            Last Update: {latest['date_time'].strftime('%Y-%m-%d %H:%M:%S')}<br>
+            Logger ID: {latest['id_logger']} | Data Points: {len(df)} | Interval: 10 minutes
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Current readings by height
+    st.subheader("📊 Current Readings by Height")
+    
+    height_colors = ['height-4m', 'height-7m', 'height-10m']
+    
+    for i, height in enumerate(HEIGHTS):
+        st.markdown(f'<div class="height-section {height_colors[i]}">', unsafe_allow_html=True)
+        st.markdown(f"### 🏗️ {height}m Height")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            temp_now = latest[COLS['tt', height, 'now']]
+            temp_avg = latest[COLS['tt', height, 'avg']]
+            temp_range = f"{latest[COLS['tt', height, 'min']]:.1f} - {latest[COLS['tt', height, 'max']]:.1f}"
+            st.metric(
+                "Temperature", 
+                f"{temp_now:.1f}°C",
+                delta=f"{temp_now - temp_avg:.1f}°C from avg",
+                help=f"Range: {temp_range}°C"
+            )
+        
+        with col2:
+            rh_now = latest[COLS['rh', height, 'now']]
+            rh_avg = latest[COLS['rh', height, 'avg']]
+            rh_range = f"{latest[COLS['rh', height, 'min']]:.1f} - {latest[COLS['rh', height, 'max']]:.1f}"
+            st.metric(
+                "Humidity", 
+                f"{rh_now:.1f}%",
+                delta=f"{rh_now - rh_avg:.1f}% from avg",
+                help=f"Range: {rh_range}%"
+            )
+        
+        with col3:
+            ws_now = latest[COLS['ws', height, 'now']]
+            ws_avg = latest[COLS['ws', height, 'avg']]
+            ws_max = latest[COLS['ws', height, 'max']]
+            st.metric(
+                "Wind Speed", 
+                f"{ws_now:.2f} m/s",
+                delta=f"{ws_now - ws_avg:.2f} m/s from avg",
+                help=f"Max: {ws_max:.2f} m/s"
+            )
+        
+        with col4:
+            wd_now = latest[COLS['wd', height, 'now']]
+            cardinal = latest_cardinals[height]
+            st.metric(
+                "Wind Direction", 
+                f"{cardinal}",
+                help=f"{wd_now:.1f}°"
+            )
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Time series comparisons
+    st.subheader("📈 Time Series Analysis")
+    
+    # Only the selected window of history is serialised to the charts
+    window = st.selectbox("🕒 Time Window", list(TIME_WINDOWS), index=1)
+    if TIME_WINDOWS[window] is None:
+        df_view = df
+    else:
+        # df is sorted by date_time, so the window start is a binary search away
+        start = df['date_time'].searchsorted(df['date_time'].iloc[-1] - TIME_WINDOWS[window])
+        df_view = df.iloc[start:]
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["🌡️ Temperature", "💧 Humidity", "💨 Wind Speed", "🧭 Wind Direction"])
+    
+    with tab1:
+        st.plotly_chart(create_temperature_comparison_chart(df_view), use_container_width=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(create_vertical_profile_chart(latest, 'tt', 'Temperature', '°C'), use_container_width=True)
+        with col2:
+            # Temperature statistics table
+            st.subheader("Temperature Statistics")
+            st.dataframe(create_statistics_table(latest, 'tt', '%.1f°C'), use_container_width=True)
+    
+    with tab2:
+        st.plotly_chart(create_humidity_comparison_chart(df_view), use_container_width=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(create_vertical_profile_chart(latest, 'rh', 'Humidity', '%'), use_container_width=True)
+        with col2:
+            # Humidity statistics table
+            st.subheader("Humidity Statistics")
+            st.dataframe(create_statistics_table(latest, 'rh', '%.1f%%'), use_container_width=True)
+    
+    with tab3:
+        st.plotly_chart(create_wind_speed_comparison_chart(df_view), use_container_width=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(create_vertical_profile_chart(latest, 'ws', 'Wind Speed', 'm/s'), use_container_width=True)
+        with col2:
+            # Wind speed statistics table
+            st.subheader("Wind Speed Statistics")
+            ws_stats = create_statistics_table(latest, 'ws', '%.2f m/s')
+            ws_stats['Sum'] = np.char.mod('%.1f', [latest[SUM_COLS[height]] for height in HEIGHTS])
+            st.dataframe(ws_stats, use_container_width=True)
+    
+    with tab4:
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.plotly_chart(create_wind_direction_chart(df_view, '4'), use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(create_wind_direction_chart(df_view, '7'), use_container_width=True)
+        
+        with col3:
+            st.plotly_chart(create_wind_direction_chart(df_view, '10'), use_container_width=True)
+    
+    # Data summary
+    st.markdown("---")
+    st.subheader("📋 Data Summary")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.info(f"""
+        **Dataset Information:**
+        - 📅 **Date Range:** {df['date_time'].min().strftime('%Y-%m-%d %H:%M')} to {df['date_time'].max().strftime('%Y-%m-%d %H:%M')}
+        - 📊 **Total Records:** {len(df):,}
+        - ⏱️ **Data Interval:** 10 minutes
+        - 🏗️ **Heights Monitored:** 4m, 7m, 10m
+        - 📈 **Parameters:** Temperature, Humidity, Wind Speed, Wind Direction
+        """)
+    
+    with col2:
+        # Recent data preview
+        st.subheader("Recent Data (Last 5 records)")
+        recent_data = df[['date_time', 'tt4_now', 'rh4_now', 'ws4_avg', 'tt7_now', 'rh7_now', 'ws7_avg', 'tt10_now', 'rh10_now', 'ws10_avg']].tail()
+        st.dataframe(recent_data, use_container_width=True)
+    
+    # Export options
+    st.markdown("---")
+    st.subheader("💾 Data Export")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.download_button(
+            label="📊 Download Current Data as CSV",
+            data=_to_csv(df),
+            file_name=f"microclimate_data_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+            mime="text/csv"
+        )
+    
+    with col2:
+        summary_stats = []
+        for height in HEIGHTS:
+            for param in ['tt', 'rh', 'ws']:
+                summary_stats.append({
+                    'Height': f'{height}m',
+                    'Parameter': param,
+                    'Current': latest[COLS[param, height, 'now']],
+                    'Average': latest[COLS[param, height, 'avg']],
+                    'Min': latest[COLS[param, height, 'min']],
+                    'Max': latest[COLS[param, height, 'max']]
+                })
+        
+        st.download_button(
+            label="📈 Download Summary Statistics",
+            data=_to_csv(pd.DataFrame(summary_stats)),
+            file_name=f"microclimate_summary_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
+            mime="text/csv"
+        )
+
+main()
\ No newline at end of file
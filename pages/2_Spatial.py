@@ -0,0 +1,480 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import json
+import hashlib
+import inspect
+import folium
+from folium.plugins import MarkerCluster
+import streamlit.components.v1 as components
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from site_data import load_site_metadata, site_frame_key
+
+# --- CONFIGURATION ---
+st.set_page_config(
+    page_title="Indonesia Microclimate Network",
+    page_icon="🗺️",
+    layout="wide"
+)
+
+# Views of the main content area, in display order
+VIEWS = ["🗺️ Interactive Map", "📊 Statistics", "📋 Site Directory", "🎯 Selected Site"]
+
+# Metadata versions whose statistics charts are kept cached
+NETWORK_CHARTS_CACHE_ENTRIES = 4
+
+# Builds the marker for a [lat, lon, name, site_id, province, district, year,
+# brand, address] row: a red star for the selected site, a lightweight circle for
+# the rest. This is the only place the site popup markup is defined
+SITE_MARKER_CALLBACK = """
+function (row, selected) {
+    var latlng = new L.LatLng(row[0], row[1]);
+    var marker = selected
+        ? L.marker(latlng, {
+            icon: L.AwesomeMarkers.icon({
+                icon: 'star', markerColor: 'red', iconColor: 'white', prefix: 'glyphicon'
+            }),
+            zIndexOffset: 1000
+        })
+        : L.circleMarker(latlng, {
+            radius: 6, color: 'blue', weight: 1, fillOpacity: 0.6
+        });
+    marker.bindPopup(
+        '<div style="width: 300px;"><h4>' + row[2] + '</h4><hr>' +
+        '<b>Site ID:</b> ' + row[3] + '<br>' +
+        '<b>Province:</b> ' + row[4] + '<br>' +
+        '<b>District:</b> ' + row[5] + '<br>' +
+        '<b>Coordinates:</b> ' + row[0].toFixed(3) + ', ' + row[1].toFixed(3) + '<br>' +
+        '<b>Installation Year:</b> ' + row[6] + '<br>' +
+        '<b>Equipment:</b> ' + row[7] + '<br>' +
+        '<b>Address:</b> ' + row[8] + '</div>',
+        {maxWidth: 350}
+    );
+    marker.bindTooltip(row[2] + ' (ID: ' + row[3] + ')');
+    return marker;
+}
+"""
+
+class _RawScript(folium.Element):
+    """Script text written into the page verbatim, without a Jinja template"""
+    
+    def __init__(self, script):
+        super().__init__()
+        self.script = script
+    
+    def render(self, **kwargs):
+        return self.script
+
+class SiteMarkerRows(folium.MacroElement):
+    """Adds site rows to a map layer through SITE_MARKER_CALLBACK
+
+    The rows are serialised with json.dumps up front and written straight into the
+    page script. folium would otherwise compile each rendered script, array
+    included, as a Jinja template.
+    """
+    
+    def __init__(self, layer, rows, selected=False):
+        super().__init__()
+        self._name = 'SiteMarkerRows'
+        # Escape '</' so no address can close the surrounding script tag
+        self.rows_json = json.dumps(rows, ensure_ascii=False).replace('</', '<\\/')
+        self.layer = layer
+        self.selected = selected
+    
+    def render(self, **kwargs):
+        script = (
+            f"(function () {{\n"
+            f"    var callback = {SITE_MARKER_CALLBACK};\n"
+            f"    var rows = {self.rows_json};\n"
+            f"    var layer = {self.layer.get_name()};\n"
+            f"    var markers = rows.map(function (row) {{ return callback(row, {json.dumps(self.selected)}); }});\n"
+            f"    // Marker clusters take the whole batch at once\n"
+            f"    if (layer.addLayers) {{\n"
+            f"        layer.addLayers(markers);\n"
+            f"    }} else {{\n"
+            f"        markers.forEach(function (marker) {{ marker.addTo(layer); }});\n"
+            f"    }}\n"
+            f"}})();\n"
+        )
+        self.get_root().script.add_child(_RawScript(script), name=self.get_name())
+
+def create_indonesia_map(df, selected_site_id=50001):
+    """Create interactive map of Indonesia with all microclimate sites"""
+    
+    # Center map on Indonesia
+    center_lat = -2.5
+    center_lon = 129.0
+    
+    # Create base map
+    m = folium.Map(
+        location=[center_lat, center_lon],
+        zoom_start=4.2,
+        tiles='OpenStreetMap'
+    )
+    
+    # Add different tile layers
+    folium.TileLayer(
+        tiles='CartoDB positron',
+        attr='© OpenStreetMap contributors © CARTO'
+    ).add_to(m)
+    
+    # Pull each column out once; missing values become 'N/A' up front
+    popup_fields = df[['nama_site', 'provinsi', 'kabupaten', 'th_pengadaan', 'merk', 'alamat']].astype(object).fillna('N/A')
+    sites = zip(
+        df['id_site'].to_numpy(dtype=np.int64).tolist(),
+        df['latitude'].tolist(),
+        df['longitude'].tolist(),
+        *(popup_fields[col].tolist() for col in popup_fields.columns)
+    )
+    
+    # Raw field rows, split into the selected site and everything else
+    selected_rows = []
+    cluster_rows = []
+    for site in sites:
+        site_id, lat, lon, name, province, district, year, brand, address = site
+        row = [lat, lon, name, site_id, province, district, year, brand, address]
+        (selected_rows if site_id == selected_site_id else cluster_rows).append(row)
+    
+    # Remaining sites are shipped as one array and drawn client-side; clusters
+    # split into individual sites once zoomed in to province level
+    cluster = MarkerCluster(name='Sites', disableClusteringAtZoom=8).add_to(m)
+    SiteMarkerRows(cluster, cluster_rows).add_to(m)
+    
+    # Selected site stays on the base map so it stands out from the cluster
+    SiteMarkerRows(m, selected_rows, selected=True).add_to(m)
+    
+    # Add layer control
+    folium.LayerControl().add_to(m)
+    
+    return m
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: site_frame_key})
+def render_indonesia_map(df, selected_site_id=50001):
+    """Standalone HTML page for the site map, rendered once per selected site"""
+    return create_indonesia_map(df, selected_site_id).get_root().render()
+
+def create_province_distribution_chart(df):
+    """Create bar chart showing site distribution by province"""
+    # Ascending order puts the largest province at the top of the horizontal bars
+    province_counts = df['provinsi'].value_counts(sort=False).sort_values()
+    
+    fig = px.bar(
+        x=province_counts.values,
+        y=province_counts.index.astype(str),
+        orientation='h',
+        title="Microclimate Sites Distribution by Province",
+        labels={'x': 'Number of Sites', 'y': 'Province'}
+    )
+    
+    fig.update_layout(
+        height=600,
+        showlegend=False
+    )
+    
+    return fig
+
+def create_installation_timeline_chart(df):
+    """Create timeline chart showing site installations over years"""
+    df_clean = df.dropna(subset=['th_pengadaan'])
+    year_counts = df_clean['th_pengadaan'].value_counts().sort_index()
+    
+    fig = px.bar(
+        x=year_counts.index,
+        y=year_counts.values,
+        title="Microclimate Sites Installation Timeline",
+        labels={'x': 'Installation Year', 'y': 'Number of Sites'}
+    )
+    
+    fig.update_layout(
+        height=400,
+        showlegend=False,
+        xaxis_title="Year",
+        yaxis_title="Number of Sites Installed"
+    )
+    
+    return fig
+
+def create_equipment_distribution_chart(df):
+    """Create pie chart showing equipment brand distribution"""
+    df_clean = df.dropna(subset=['merk'])
+    brand_counts = df_clean['merk'].value_counts()
+    
+    fig = px.pie(
+        values=brand_counts.values,
+        names=brand_counts.index,
+        title="Equipment Brand Distribution",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    
+    fig.update_layout(height=400)
+    
+    return fig
+
+# Statistics charts shown in the statistics view, by name
+NETWORK_CHART_BUILDERS = {
+    'province': create_province_distribution_chart,
+    'equipment': create_equipment_distribution_chart,
+    'timeline': create_installation_timeline_chart
+}
+
+# Derived from the builders' source, so figures persisted on disk by older code
+# are never served after the builders change
+NETWORK_CHARTS_VERSION = hashlib.sha256(
+    ''.join(inspect.getsource(builder) for builder in NETWORK_CHART_BUILDERS.values()).encode()
+).hexdigest()
+
+@st.cache_data(show_spinner=False, persist="disk", max_entries=NETWORK_CHARTS_CACHE_ENTRIES)
+def _network_figures_json(source_version, charts_version):
+    """Statistics chart JSON, persisted on disk per metadata file and chart version
+
+    The charts depend on nothing but the metadata and their builders, so a
+    restarted app reads them back instead of aggregating and rebuilding them.
+    """
+    df = load_site_metadata()
+    return {name: builder(df).to_json() for name, builder in NETWORK_CHART_BUILDERS.items()}
+
+@st.cache_resource(show_spinner=False, max_entries=NETWORK_CHARTS_CACHE_ENTRIES)
+def load_network_figures(source_version, charts_version):
+    """Statistics charts restored from their persisted JSON"""
+    figures_json = _network_figures_json(source_version, charts_version)
+    return {name: pio.from_json(fig_json) for name, fig_json in figures_json.items()}
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: site_frame_key})
+def summarize_sites(df):
+    """Network-wide figures shown in the map and statistics views"""
+    years = df['th_pengadaan'].dropna()
+    
+    return {
+        'n_sites': len(df),
+        'n_provinces': df['provinsi'].nunique(),
+        'n_districts': df['kabupaten'].nunique(),
+        'n_subdistricts': df['kecamatan'].nunique(),
+        'lat_min': df['latitude'].min(),
+        'lat_max': df['latitude'].max(),
+        'lon_min': df['longitude'].min(),
+        'lon_max': df['longitude'].max(),
+        'first_year': int(years.min()) if len(years) else None,
+        'top_brands': df['merk'].value_counts().head(5).to_dict()
+    }
+
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: site_frame_key})
+def create_site_options(df, default_site_id=50001):
+    """Selectbox labels for every site and the position of the default site"""
+    site_ids = df['id_site'].to_numpy()
+    options = [f"{site_id} - {name}" for site_id, name in zip(site_ids.tolist(), df['nama_site'].tolist())]
+    
+    # Fall back to the first site if the default is missing
+    matches = np.flatnonzero(site_ids == default_site_id)
+    default_index = int(matches[0]) if matches.size else 0
+    
+    return options, default_index
+
+@st.cache_data(show_spinner=False)
+def _site_csv(_search_df: pd.DataFrame, search_term: str) -> bytes:
+    """Serialise the directory rows for download
+
+    The rows follow from the search term alone, so the term is the cache key and
+    the frame itself is never hashed.
+    """
+    return _search_df.drop(columns='_search').to_csv(index=False).encode()
+
+def main():
+    st.title("🗺️ Indonesia Microclimate Network")
+    st.markdown("---")
+    
+    # Load site metadata
+    df = load_site_metadata()
+    
+    if df is None:
+        st.error("Failed to load site metadata.")
+        return
+    
+    summary = summarize_sites(df)
+    
+    # Sidebar for site selection only
+    st.sidebar.header("🔍 Site Selection")
+    
+    # Site selection
+    site_options, default_index = create_site_options(df)
+
+    selected_site_display = st.sidebar.selectbox(
+        "Select Site for Detailed Analysis:",
+        options=site_options,
+        index=default_index
+    )
+
+    # Extract selected site ID right after selectbox
+    selected_site_id = int(selected_site_display.split(' - ')[0])
+    
+    # No more province or equipment filters
+    
+    # Main content views; only the active one is built on each rerun
+    active_view = st.radio(
+        "View",
+        VIEWS,
+        horizontal=True,
+        key='active_tab',
+        label_visibility="collapsed"
+    )
+    
+    if active_view == VIEWS[0]:
+        st.subheader("🌍 Indonesia Microclimate Sites Map")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Sites", summary['n_sites'])
+        with col2:
+            st.metric("Provinces Covered", summary['n_provinces'])
+        with col3:
+            st.metric("Active Since", summary['first_year'] if summary['first_year'] is not None else "N/A")
+        
+        # Embed the rendered map; the selection comes from the sidebar, so no
+        # map state needs to flow back to the script
+        components.html(render_indonesia_map(df, selected_site_id), width=1200, height=600)
+        
+        # Map legend
+        st.markdown("""
+        **Map Legend:**
+        - 🔴 **Red Star**: Currently selected site for detailed analysis
+        - 🔵 **Blue Circles**: Other microclimate monitoring sites (clustered when zoomed out)
+        - Click on markers for detailed site information
+        """)
+    
+    elif active_view == VIEWS[1]:
+        st.subheader("📈 Network Statistics")
+        
+        figures = load_network_figures(df.attrs['source_version'], NETWORK_CHARTS_VERSION)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.plotly_chart(figures['province'], use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(figures['equipment'], use_container_width=True)
+        
+        st.plotly_chart(figures['timeline'], use_container_width=True)
+        
+        # Summary statistics
+        st.subheader("📊 Network Summary")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.info(f"""
+            **Geographic Coverage:**
+            - **Northernmost:** {summary['lat_max']:.3f}°
+            - **Southernmost:** {summary['lat_min']:.3f}°
+            - **Easternmost:** {summary['lon_max']:.3f}°
+            - **Westernmost:** {summary['lon_min']:.3f}°
+            """)
+        
+        with col2:
+            st.info(f"""
+            **Administrative Coverage:**
+            - **Provinces:** {summary['n_provinces']}
+            - **Districts:** {summary['n_districts']}
+            - **Sub-districts:** {summary['n_subdistricts']}
+            """)
+        
+        with col3:
+            equipment_text = "\n".join([f"- **{brand}:** {count}" for brand, count in summary['top_brands'].items()])
+            st.info(f"""
+            **Equipment Brands:**
+            {equipment_text}
+            """)
+    
+    elif active_view == VIEWS[2]:
+        st.subheader("📋 Complete Site Directory")
+        
+        # Search functionality; the term only applies on submit, not per keystroke
+        with st.form('site_search', clear_on_submit=False):
+            search_term = st.text_input("🔍 Search sites by name or location:")
+            st.form_submit_button("Search")
+        
+        if search_term:
+            search_df = df[df['_search'].str.contains(search_term.lower(), regex=False, na=False)]
+        else:
+            search_df = df
+        
+        # Display sites table
+        display_columns = ['id_site', 'nama_site', 'provinsi', 'kabupaten', 'latitude', 'longitude', 'th_pengadaan', 'merk']
+        st.dataframe(
+            search_df[display_columns].sort_index(),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'id_site': 'Site ID',
+                'nama_site': 'Site Name',
+                'provinsi': 'Province',
+                'kabupaten': 'District',
+                'latitude': st.column_config.NumberColumn('Latitude', format="%.3f"),
+                'longitude': st.column_config.NumberColumn('Longitude', format="%.3f"),
+                'th_pengadaan': 'Installation Year',
+                'merk': 'Equipment Brand'
+            }
+        )
+        
+        # Export functionality
+        st.download_button(
+            label="📥 Download Site Data",
+            data=_site_csv(search_df, search_term),
+            file_name=f"microclimate_sites_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv"
+        )
+    
+    elif active_view == VIEWS[3]:
+        st.subheader(f"🎯 Selected Site Details")
+        
+        # Get selected site details
+        selected_site = df.loc[selected_site_id]
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown(f"""
+            ### 📍 {selected_site['nama_site']}
+            
+            **Basic Information:**
+            - **Site ID:** {selected_site['id_site']}
+            - **Site Type:** {selected_site['id_jenis'] if pd.notna(selected_site['id_jenis']) else 'N/A'}
+            - **Installation Year:** {int(selected_site['th_pengadaan']) if pd.notna(selected_site['th_pengadaan']) else 'N/A'}
+            - **Equipment:** {selected_site['merk'] if pd.notna(selected_site['merk']) else 'N/A'} {selected_site['tipe'] if pd.notna(selected_site['tipe']) else ''}
+            
+            **Location:**
+            - **Province:** {selected_site['provinsi']}
+            - **District:** {selected_site['kabupaten']}
+            - **Sub-district:** {selected_site['kecamatan']}
+            - **Village:** {selected_site['desa'] if pd.notna(selected_site['desa']) else 'N/A'}
+            """)
+        
+        with col2:
+            st.markdown(f"""
+            ### 🌍 Geographic Details
+            
+            **Coordinates:**
+            - **Latitude:** {selected_site['latitude']:.6f}°
+            - **Longitude:** {selected_site['longitude']:.6f}°
+            - **Elevation:** {selected_site['elevasi'] if pd.notna(selected_site['elevasi']) else 'N/A'} m
+            
+            **Administrative:**
+            - **Regional Office:** {selected_site['kanwil'] if pd.notna(selected_site['kanwil']) else 'N/A'}
+            - **Postal Code:** {selected_site['pos'] if pd.notna(selected_site['pos']) else 'N/A'}
+            - **Procurement:** {selected_site['pengadaan'] if pd.notna(selected_site['pengadaan']) else 'N/A'}
+            
+            **Address:**
+            {selected_site['alamat'] if pd.notna(selected_site['alamat']) else 'Address not available'}
+            """)
+        
+        # Link to detailed analysis
+        st.markdown("---")
+        st.info(f"""
+        💡 **Ready to analyze data from {selected_site['nama_site']}?**
+        
+        If you have microclimate data for this site, you can use the main dashboard to visualize and analyze the measurements.
+        The current dashboard is configured for Site ID {selected_site_id}.
+        """)
+
+main()
\ No newline at end of file
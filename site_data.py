@@ -0,0 +1,87 @@
+import streamlit as st
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pathlib import Path
+
+# Site metadata ships alongside the app, independent of the working directory
+SITE_METADATA_PATH = Path(__file__).resolve().parent / 'metadata_site_ikro.csv'
+
+# Fixed schema for the numeric columns, parsed straight from the CSV text
+SITE_COLUMN_TYPES = {
+    'id_site': pa.int64(),
+    'latitude': pa.float64(),
+    'longitude': pa.float64(),
+    'elevasi': pa.float64(),
+    'th_pengadaan': pa.int32(),
+}
+
+# Administrative and equipment labels repeat across sites
+SITE_CATEGORY_COLUMNS = ('provinsi', 'kabupaten', 'kecamatan', 'merk', 'pengadaan', 'kanwil')
+
+# Typed read schema; repeated labels are dictionary-encoded while parsing
+SITE_READ_TYPES = {
+    **SITE_COLUMN_TYPES,
+    **{col: pa.dictionary(pa.int32(), pa.string()) for col in SITE_CATEGORY_COLUMNS}
+}
+
+
+def site_frame_key(df):
+    """Cache key for the shared site frame, whose identity is stable while cached"""
+    return id(df), len(df)
+
+
+@st.cache_resource(show_spinner=False)
+def load_site_metadata():
+    """Load site metadata from CSV
+
+    Cached as a shared resource so every page and session reuses the same
+    DataFrame; callers must treat it as read-only.
+    """
+    try:
+        try:
+            # Parse straight from a memory map on pyarrow's threaded reader
+            with pa.memory_map(str(SITE_METADATA_PATH)) as source:
+                table = pa_csv.read_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(use_threads=True),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types=SITE_READ_TYPES,
+                        strings_can_be_null=True
+                    )
+                )
+            # Dictionary columns arrive as pandas categoricals
+            df = table.to_pandas()
+        except pa.ArrowInvalid:
+            # A malformed numeric cell; read untyped and blank out what doesn't parse
+            df = pd.read_csv(SITE_METADATA_PATH)
+            for col in SITE_COLUMN_TYPES:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        
+        # Remove rows with invalid coordinates
+        df = df.dropna(subset=['latitude', 'longitude'])
+        
+        # Lowercased name and location text, matched by the site directory search
+        df['_search'] = df['nama_site'].str.cat(
+            [df['provinsi'].astype(object), df['kabupaten'].astype(object)],
+            sep='|',
+            na_rep=''
+        ).str.lower()
+        
+        # Site IDs are unique, so label lookups by ID go through the index; it is
+        # left unnamed so 'id_site' still resolves to the column alone
+        df.index = df['id_site'].to_numpy()
+        
+        # Store repeated labels as categories, limited to the sites that remain
+        for col in SITE_CATEGORY_COLUMNS:
+            df[col] = df[col].astype('category').cat.remove_unused_categories()
+        
+        # Identifies the file contents this frame was built from, for disk caches
+        stat = SITE_METADATA_PATH.stat()
+        df.attrs['source_version'] = (stat.st_mtime_ns, stat.st_size)
+        
+        return df
+        
+    except Exception as e:
+        st.error(f"Error loading site metadata: {str(e)}")
+        return None